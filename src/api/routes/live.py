@@ -1,6 +1,7 @@
 """Live matches endpoints."""
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.api.dependencies import get_db
@@ -10,12 +11,26 @@ from src.storage.repositories import MatchRepository
 
 router = APIRouter()
 
+# /live is polled frequently. The ORM rows are still fully validated into
+# MatchWithRelations (from_attributes does the ORM -> schema conversion, so it
+# cannot be dropped); what this skips is FastAPI 0.128's second pass that
+# serializes the models to Python objects and runs stdlib json.dumps on them.
+# dump_json writes JSON bytes directly. FastAPI >= 0.130 does validate +
+# dump_json natively, after which this can go back to a plain return.
+_live_adapter = TypeAdapter(list[MatchWithRelations])
+
+
+def _live_response(matches: list[Match]) -> Response:
+    """Serialize live matches to a JSON response in a single pass."""
+    items = _live_adapter.validate_python(matches, from_attributes=True)
+    return Response(content=_live_adapter.dump_json(items), media_type="application/json")
+
 
 @router.get("", response_model=list[MatchWithRelations])
 def get_all_live_matches(
     sport: Sport | None = Query(None, description="Filter by sport"),
     db: Session = Depends(get_db),
-) -> list[Match]:
+) -> Response:
     """
     Get all live matches across all sports or filtered by sport.
 
@@ -28,14 +43,14 @@ def get_all_live_matches(
     """
     repo = MatchRepository(db)
     matches = repo.get_live(sport=sport.value if sport else None, load_relations=True)
-    return matches
+    return _live_response(matches)
 
 
 @router.get("/{sport}", response_model=list[MatchWithRelations])
 def get_live_matches_by_sport(
     sport: Sport,
     db: Session = Depends(get_db),
-) -> list[Match]:
+) -> Response:
     """
     Get live matches for a specific sport.
 
@@ -48,4 +63,4 @@ def get_live_matches_by_sport(
     """
     repo = MatchRepository(db)
     matches = repo.get_live(sport=sport.value, load_relations=True)
-    return matches
+    return _live_response(matches)
@@ -1,7 +1,7 @@
 """Browser automation module for SofaScore data collection."""
 
 from .manager import BrowserManager
-from .interceptor import ResponseInterceptor, create_interceptor, API_PATTERNS
+from .interceptor import ResponseInterceptor, ParsedRoute, create_interceptor, API_PATTERNS
 from .ws_interceptor import (
     WebSocketInterceptor,
     LiveScoreWebSocketInterceptor,
@@ -11,6 +11,7 @@ from .ws_interceptor import (
 __all__ = [
     "BrowserManager",
     "ResponseInterceptor",
+    "ParsedRoute",
     "create_interceptor",
     "API_PATTERNS",
     "WebSocketInterceptor",
@@ -10,12 +10,11 @@ navigating a full page.
 """
 
 import logging
-import re
 
 from playwright.async_api import Page
 
 from src.browser.header_capture import HeaderCapture
-from src.browser.interceptor import API_PATTERNS
+from src.browser.interceptor import API_PATTERNS, ParsedRoute, parse_api_url
 
 logger = logging.getLogger(__name__)
 
@@ -60,16 +59,16 @@ class DirectApiFetcher:
         sport: str | None = None,
         date: str | None = None,
         url: str | None = None,
-    ) -> tuple[dict, re.Match] | None:
+    ) -> tuple[dict, ParsedRoute] | None:
         """Fetch and parse API JSON for a pattern.
 
         Either provide ``url`` directly (e.g. a captured ``featured`` URL) or
         the parameters needed to build it.
 
         Returns:
-            ``(data, match)`` where ``match`` is produced by re-running the
-            pattern regex against the URL (so existing handlers work unchanged),
-            or ``None`` on failure.
+            ``(data, route)`` where ``route`` is the ``ParsedRoute`` the
+            interceptor would have produced for the URL (so existing handlers
+            work unchanged), or ``None`` on failure.
         """
         if not self.header_capture.is_ready:
             logger.debug("Direct fetch skipped: no token captured yet")
@@ -80,13 +79,12 @@ class DirectApiFetcher:
             logger.debug(f"Direct fetch skipped: could not build URL for '{pattern}'")
             return None
 
-        regex = API_PATTERNS.get(pattern)
-        if not regex:
+        if pattern not in API_PATTERNS:
             logger.debug(f"Direct fetch skipped: unknown pattern '{pattern}'")
             return None
 
-        match = regex.search(target_url)
-        if not match:
+        route = parse_api_url(target_url.partition("?")[0])
+        if route is None or route.name != pattern:
             logger.debug(f"Direct fetch skipped: URL did not match '{pattern}': {target_url}")
             return None
 
@@ -131,4 +129,4 @@ class DirectApiFetcher:
             return None
 
         logger.info(f"Direct fetch ok ({pattern}): {target_url}")
-        return data, match
+        return data, route
@@ -1,26 +1,156 @@
-import json
 from playwright.async_api import Page, Response
 import asyncio
 import logging
 import re
-from typing import Callable, Awaitable, Pattern
+from typing import Callable, Awaitable, NamedTuple, Pattern
+
+from src.config import settings
+
+try:
+    import orjson as _json  # parses bytes directly, no intermediate str
+except ImportError:
+    import json as _json
 
 logger = logging.getLogger(__name__)
 
 
+class ParsedRoute(NamedTuple):
+    """
+    Fields extracted from an intercepted API URL.
+
+    Handed to handlers instead of an ``re.Match`` so no regex state or URL
+    string is kept alive while responses wait in the queue. ``group()`` and
+    ``lastindex`` mirror the match API older handlers rely on
+    (group 1 = sport, group 2 = date).
+    """
+
+    name: str
+    sport: str
+    date: str | None = None
+
+    @property
+    def lastindex(self) -> int:
+        """Number of captured groups, as on ``re.Match``."""
+        return 1 if self.date is None else 2
+
+    def group(self, index: int = 1) -> str:
+        """Return a captured group by its regex group number."""
+        if index == 1:
+            return self.sport
+        if index == 2 and self.date is not None:
+            return self.date
+        raise IndexError("no such group")
+
+
+# Handler signature: async def handler(data: dict, route: ParsedRoute) -> None
+Handler = Callable[[dict, ParsedRoute], Awaitable[None]]
+
 # Patterns de interes pentru interceptare
 
+# Reference definition of the intercepted endpoints, matched against the URL
+# without its query string. Dispatch uses parse_api_url, which must accept
+# exactly what these accept; the patterns are kept as its specification.
 API_PATTERNS: dict[str, Pattern] = {
     "scheduled": re.compile(
-        r"/api/v1/sport/([\w-]+)/scheduled-events/(\d{4}-\d{2}-\d{2})(?!/inverse)"
+        r"/api/v1/sport/([\w-]+)/scheduled-events/([0-9]{4}-[0-9]{2}-[0-9]{2})$"
     ),
-    "live": re.compile(r"/api/v1/sport/([\w-]+)/events/live"),
-    "featured": re.compile(r"/api/v1/odds/\d+/featured-events/([\w-]+)"),
+    "live": re.compile(r"/api/v1/sport/([\w-]+)/events/live$"),
+    "featured": re.compile(r"/api/v1/odds/[0-9]+/featured-events/([\w-]+)$"),
     "inverse": re.compile(
-        r"/api/v1/sport/([\w-]+)/scheduled-events/(\d{4}-\d{2}-\d{2})/inverse"
+        r"/api/v1/sport/([\w-]+)/scheduled-events/([0-9]{4}-[0-9]{2}-[0-9]{2})/inverse$"
     ),
 }
 
+# Pattern names bound once at import (API_PATTERNS itself never changes)
+_PATTERN_NAMES: tuple[str, ...] = tuple(API_PATTERNS)
+
+# Every pattern above lives under this prefix; cheap substring reject first
+_API_PREFIX = "/api/v1/"
+_JSON_CONTENT_TYPE = "application/json"
+
+# The API is only ever called from page scripts; images, stylesheets, fonts,
+# documents etc. can be dropped without looking at their URL
+_API_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+
+
+def _should_process(response: Response) -> bool:
+    """Check that a response is OK and carries a JSON body."""
+    if not response.ok:
+        logger.debug(
+            f"Skipping non-OK response: {response.url} (status: {response.status})"
+        )
+        return False
+
+    # response.headers is already materialised locally; header_value()
+    # would cost an extra round-trip to the Playwright driver
+    if not response.headers.get("content-type", "").startswith(_JSON_CONTENT_TYPE):
+        logger.debug(f"Skipping non-JSON response: {response.url}")
+        return False
+
+    return True
+
+
+def _is_digits(value: str) -> bool:
+    """Check for ``[0-9]+``; str.isdigit() alone also accepts non-ASCII digits."""
+    return value.isascii() and value.isdigit()
+
+
+def _is_slug(value: str) -> bool:
+    """Check for the ``[\\w-]+`` segments captured by the patterns."""
+    return bool(value) and all(c.isalnum() or c in "_-" for c in value)
+
+
+def _is_date(value: str) -> bool:
+    """Check for the YYYY-MM-DD shape captured by the scheduled patterns."""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and _is_digits(value[:4])
+        and _is_digits(value[5:7])
+        and _is_digits(value[8:])
+    )
+
+
+def parse_api_url(path: str) -> ParsedRoute | None:
+    """
+    Classify a URL against API_PATTERNS using plain string operations.
+
+    The intercepted endpoints have fixed path layouts, so splitting on the
+    known segments is enough and avoids running any regex on the hot path.
+
+    Args:
+        path: URL without its query string
+
+    Returns:
+        ParsedRoute, or None if the URL is not an intercepted endpoint
+    """
+    _, found, rest = path.partition(_API_PREFIX)
+    if not found:
+        return None
+
+    kind, _, rest = rest.partition("/")
+    key, _, rest = rest.partition("/")
+    if not key:
+        return None
+
+    if kind == "sport" and _is_slug(key):
+        if rest == "events/live":
+            return ParsedRoute("live", key)
+        if rest.startswith("scheduled-events/"):
+            date = rest[17:27]
+            if _is_date(date):
+                if len(rest) == 27:
+                    return ParsedRoute("scheduled", key, date)
+                if rest[27:] == "/inverse":
+                    return ParsedRoute("inverse", key, date)
+    elif kind == "odds" and _is_digits(key) and rest.startswith("featured-events/"):
+        sport = rest[16:]
+        if _is_slug(sport):
+            return ParsedRoute("featured", sport)
+
+    return None
+
 
 class ResponseInterceptor:
     """
@@ -30,30 +160,54 @@ class ResponseInterceptor:
     responses to appropriate handlers.
     """
 
+    # "__dict__" stays: Playwright caches the wrapper for a bound-method
+    # listener (page.on("response", self._on_response)) as an attribute on
+    # the instance, which a fully slotted class cannot take
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "page",
+        "handlers",
+        "_queue",
+        "_dropped",
+        "_worker",
+        "_inverse_tasks",
+        "_loop",
+        "_exact",
+    )
+
     page: Page | None
+    handlers: dict[str, tuple[Handler, ...]]
 
     def __init__(self, page: Page | None = None):
         """Initialize response interceptor."""
         self.page = page
-        self.handlers: dict[str, list[Callable[[dict, re.Match], Awaitable[None]]]] = {
-            pattern_name: [] for pattern_name in API_PATTERNS.keys()
-        }
-        self._queue: asyncio.Queue = asyncio.Queue()
-
-    def on(
-        self, pattern_name: str, handler: Callable[[dict, re.Match], Awaitable[None]]
-    ) -> None:
+        # Handlers are stored as tuples and replaced on every mutation, so
+        # dispatch can iterate a snapshot without copying or locking.
+        self.handlers = dict.fromkeys(_PATTERN_NAMES, ())
+        # Bounded so a burst of responses cannot grow memory without limit
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=settings.max_queue_size)
+        self._dropped = 0
+        self._worker: asyncio.Task | None = None
+        # Strong references to in-flight inverse fetches, so they are not
+        # garbage-collected mid-run and can be cancelled on detach
+        self._inverse_tasks: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Known URLs resolved ahead of time
+        self._exact: dict[str, ParsedRoute] = {}
+
+    def on(self, pattern_name: str, handler: Handler) -> None:
         """
         Register a handler for a specific API pattern.
 
         Args:
             pattern_name: Name of the pattern (e.g., 'live', 'event', 'statistics')
             handler: Async function to handle the response data
-                     Signature: async def handler(data: dict, match: re.Match) -> None
+                     Signature: async def handler(data: dict, route: ParsedRoute) -> None
 
         Example:
-            async def handle_live_matches(data: dict, match: re.Match) -> None:
-                sport = match.group(1)
+            async def handle_live_matches(data: dict, route: ParsedRoute) -> None:
+                sport = route.sport
                 print(f"Live matches for {sport}: {len(data['events'])}")
 
             interceptor.on('live', handle_live_matches)
@@ -61,11 +215,36 @@ class ResponseInterceptor:
         if pattern_name not in API_PATTERNS:
             raise ValueError(
                 f"Unknown pattern '{pattern_name}'. "
-                f"Available: {list(API_PATTERNS.keys())}"
+                f"Available: {list(_PATTERN_NAMES)}"
             )
-        self.handlers[pattern_name].append(handler)
+        self.handlers[pattern_name] = self.handlers[pattern_name] + (handler,)
         logger.debug(f"Registered handler for pattern '{pattern_name}'")
 
+    def register_exact(self, url: str, pattern_name: str) -> None:
+        """
+        Pre-resolve a URL that is expected to be intercepted repeatedly.
+
+        Responses for registered URLs are dispatched with a single dict
+        lookup, skipping URL parsing.
+
+        Args:
+            url: Exact response URL (including any query string)
+            pattern_name: Pattern the URL belongs to
+
+        Raises:
+            ValueError: If the pattern is unknown or does not match the URL
+        """
+        if pattern_name not in API_PATTERNS:
+            raise ValueError(
+                f"Unknown pattern '{pattern_name}'. "
+                f"Available: {list(_PATTERN_NAMES)}"
+            )
+        route = parse_api_url(url.partition("?")[0])
+        if route is None or route.name != pattern_name:
+            raise ValueError(f"URL does not match pattern '{pattern_name}': {url}")
+        self._exact[url] = route
+        logger.debug(f"Registered exact URL for pattern '{pattern_name}': {url}")
+
     async def attach(self, page: Page) -> None:
         """
         Attach interceptor to a Playwright page.
@@ -74,9 +253,43 @@ class ResponseInterceptor:
             page: Playwright page to monitor
         """
         self.page = page
+        # page.route() would not help here: it does not filter "response"
+        # events, and every routed request would need a Python round-trip to
+        # be continued. Non-API responses are rejected cheaply in _on_response.
         page.on("response", self._on_response)
+        # Playwright fires response events on this loop's thread, so all
+        # scheduling below can use the plain same-thread loop APIs.
+        self._loop = asyncio.get_running_loop()
+        if self._worker is None:
+            self._worker = self._loop.create_task(self._drain())
         logger.info("Response interceptor attached to page")
 
+    async def detach(self) -> None:
+        """Stop listening for responses and cancel the worker and inverse fetches."""
+        if self.page:
+            self.page.remove_listener("response", self._on_response)
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        tasks = list(self._inverse_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info("Response interceptor detached")
+
+    async def drain(self) -> None:
+        """
+        Wait until every queued response has been dispatched.
+
+        Inverse responses are handed off to their own task, so this does not
+        wait for their tab fetch to finish.
+        """
+        await self._queue.join()
+
     async def _on_response(self, response: Response) -> None:
         """
         Internal handler for all responses.
@@ -84,28 +297,69 @@ class ResponseInterceptor:
         Args:
             response: Playwright Response object
         """
+        try:
+            if response.request.resource_type not in _API_RESOURCE_TYPES:
+                return
+        except AttributeError:
+            pass  # no request info (e.g. a bare stub): fall back to URL checks
+
         url = response.url
 
-        # Check if response matches any pattern
-        for pattern_name, pattern in API_PATTERNS.items():
-            match = pattern.search(url)
-            if match:
-                asyncio.create_task(
-                    self._process_response(response, pattern_name, match)
-                )
-                break
+        route = self._exact.get(url)
+        if route is None:
+            # Endpoints are matched on the path, so drop the query once here.
+            # Most responses (assets, tracking, ...) are rejected by the first
+            # substring scan inside parse_api_url
+            route = parse_api_url(url.partition("?")[0])
+            if route is None:
+                return
+
+        try:
+            self._queue.put_nowait((response, route))
+        except asyncio.QueueFull:
+            self._dropped += 1
+            logger.warning(
+                f"Response queue full, dropping {route.name}: {url} "
+                f"({self._dropped} dropped so far)"
+            )
+
+    async def _drain(self) -> None:
+        """
+        Long-lived worker that feeds queued responses to _process_response.
 
-    async def _process_response(
-        self, response: Response, pattern_name: str, match: re.Match
-    ) -> None:
+        Inverse responses are fetched in a separate tab, which can take
+        seconds, so they get their own task instead of stalling the queue.
+        """
+        while True:
+            response, route = await self._queue.get()
+            try:
+                if route.name == "inverse" and self._loop:
+                    task = self._loop.create_task(
+                        self._process_response(response, route)
+                    )
+                    self._inverse_tasks.add(task)
+                    task.add_done_callback(self._inverse_tasks.discard)
+                else:
+                    await self._process_response(response, route)
+            finally:
+                self._queue.task_done()
+
+    async def _process_response(self, response: Response, route: ParsedRoute) -> None:
         """
         Process a matched response.
 
         Args:
             response: Playwright Response object
-            pattern_name: Name of matched pattern
-            match: Regex match object
+            route: Parsed route of the matched URL
         """
+        pattern_name = route.name
+
+        # Nobody listening: skip the body read / JSON parse (or inverse tab) entirely
+        handlers = self.handlers.get(pattern_name, ())
+        if not handlers:
+            logger.debug(f"No handlers registered for pattern '{pattern_name}'")
+            return
+
         try:
             data = None
             if pattern_name == "inverse":
@@ -114,33 +368,27 @@ class ResponseInterceptor:
                         f"Opening inverse URL in new tab to fetch content: {response.url}"
                     )
                     new_page = await self.page.context.new_page()
-                    await new_page.goto(response.url)
-                    await new_page.wait_for_load_state("networkidle")
-
-                    pre_element = await new_page.query_selector("pre")
-                    if pre_element:
-                        json_text = await pre_element.inner_text()
-                        data = json.loads(json_text)
-                    else:
-                        json_text = await new_page.locator("body").text_content()
-                        if json_text:
-                            data = json.loads(json_text)
-
-                    await new_page.close()
+                    # Closed on every path, including cancellation on detach
+                    try:
+                        await new_page.goto(response.url)
+                        await new_page.wait_for_load_state("networkidle")
+
+                        pre_element = await new_page.query_selector("pre")
+                        if pre_element:
+                            json_text = await pre_element.inner_text()
+                            data = _json.loads(json_text)
+                        else:
+                            json_text = await new_page.locator("body").text_content()
+                            if json_text:
+                                data = _json.loads(json_text)
+                    finally:
+                        await new_page.close()
             else:
-                if not response.ok:
-                    logger.debug(
-                        f"Skipping non-OK response: {response.url} (status: {response.status})"
-                    )
-                    return
-
-                content_type = response.headers.get("content-type", "")
-                if "application/json" not in content_type:
-                    logger.debug(f"Skipping non-JSON response: {response.url}")
+                if not _should_process(response):
                     return
 
                 try:
-                    data = await response.json()
+                    data = _json.loads(await response.body())
                 except Exception as e:
                     logger.warning(f"Failed to parse JSON from {response.url}: {e}")
                     return
@@ -151,24 +399,28 @@ class ResponseInterceptor:
 
             logger.info(f"Intercepted {pattern_name}: {response.url}")
 
-            handlers = self.handlers.get(pattern_name, [])
-            if handlers:
-                for handler in handlers:
-                    try:
-                        await handler(data, match)
-                    except Exception as e:
-                        logger.error(
-                            f"Handler error for {pattern_name} ({response.url}): {e}",
-                            exc_info=True,
-                        )
-            else:
-                logger.debug(f"No handlers registered for pattern '{pattern_name}'")
+            # Run handlers concurrently; one failing does not stop the others
+            results = await asyncio.gather(
+                *(handler(data, route) for handler in handlers),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"Handler error for {pattern_name} ({response.url}): {result}",
+                        exc_info=result,
+                    )
 
         except Exception as e:
             logger.error(
                 f"Error processing response {response.url}: {e}", exc_info=True
             )
 
+    @property
+    def dropped(self) -> int:
+        """Get count of responses dropped because the queue was full."""
+        return self._dropped
+
     def remove_handler(self, pattern_name: str, handler: Callable) -> None:
         """
         Remove a specific handler for a pattern.
@@ -178,7 +430,9 @@ class ResponseInterceptor:
             handler: Handler function to remove
         """
         if pattern_name in self.handlers and handler in self.handlers[pattern_name]:
-            self.handlers[pattern_name].remove(handler)
+            remaining = list(self.handlers[pattern_name])
+            remaining.remove(handler)
+            self.handlers[pattern_name] = tuple(remaining)
             logger.debug(f"Removed handler for pattern '{pattern_name}'")
 
     def clear_handlers(self, pattern_name: str | None = None) -> None:
@@ -190,11 +444,10 @@ class ResponseInterceptor:
         """
         if pattern_name:
             if pattern_name in self.handlers:
-                self.handlers[pattern_name].clear()
+                self.handlers[pattern_name] = ()
                 logger.debug(f"Cleared handlers for pattern '{pattern_name}'")
         else:
-            for handlers_list in self.handlers.values():
-                handlers_list.clear()
+            self.handlers = dict.fromkeys(_PATTERN_NAMES, ())
             logger.debug("Cleared all handlers")
 
 async def create_interceptor(page: Page) -> ResponseInterceptor:
@@ -2,12 +2,57 @@
 
 from playwright.async_api import Page, WebSocket
 import asyncio
-import json
 import logging
-from typing import Callable, Awaitable
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Awaitable
+
+from src.config import settings
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logger = logging.getLogger(__name__)
 
+# Handlers receive a read-only view of a JSON object, so only frames starting
+# with "{" are parsed; arrays, pings, acks and other text frames are rejected
+# without calling the parser
+_JSON_STARTS = ("{", b"{")
+
+# Message type variants handled by LiveScoreWebSocketInterceptor
+_SCORE_TYPES = frozenset({"score", "scoreChange", "scoreUpdate"})
+_INCIDENT_TYPES = frozenset({"incident", "incidentChange", "newIncident"})
+
+# Pieces for spotting a routed "type" value in a frame without parsing it,
+# keyed by payload type: (key, separator, closing quote, routed types)
+_TYPE_SNIFF = {
+    str: ('"type"', ':"', '"', _SCORE_TYPES | _INCIDENT_TYPES),
+    bytes: (
+        b'"type"',
+        b':"',
+        b'"',
+        frozenset(t.encode() for t in _SCORE_TYPES | _INCIDENT_TYPES),
+    ),
+}
+
+# Handler signatures: async def handler(data: Mapping) -> None
+#                     async def raw_handler(data: Mapping, raw: str | bytes) -> None
+# Handlers share one read-only view of the message; copy it to modify.
+Handler = Callable[[Mapping[str, Any]], Awaitable[None]]
+RawHandler = Callable[[Mapping[str, Any], str | bytes], Awaitable[None]]
+
+
+def _without(handlers: tuple, handler: Callable) -> tuple:
+    """Return ``handlers`` minus the first entry equal to ``handler``."""
+    # list.remove compares with ==, which bound methods need (they are
+    # recreated on every attribute access, so identity never matches)
+    remaining = list(handlers)
+    remaining.remove(handler)
+    return tuple(remaining)
+
 
 class WebSocketInterceptor:
     """
@@ -19,27 +64,54 @@ class WebSocketInterceptor:
 
     def __init__(self):
         """Initialize WebSocket interceptor."""
-        self.handlers: list[Callable[[dict], Awaitable[None]]] = []
-        self._active_sockets: list[WebSocket] = []
-
-    def on_message(self, handler: Callable[[dict], Awaitable[None]]) -> None:
+        # Handlers are stored as tuples and replaced on every mutation, so
+        # dispatch iterates a snapshot even if a handler (un)registers others
+        self.handlers: tuple[Handler, ...] = ()
+        # Handlers that also get the original frame payload
+        self.raw_handlers: tuple[RawHandler, ...] = ()
+        # Weak so a socket whose close event never fires (crash, network
+        # drop) is not kept alive by the interceptor
+        self._active_sockets: weakref.WeakSet[WebSocket] = weakref.WeakSet()
+        # Frames are queued and dispatched by one long-lived worker instead
+        # of a task per frame; bounded so a burst cannot grow memory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=settings.max_queue_size)
+        self._dropped = 0
+        self._worker: asyncio.Task | None = None
+        self._page: Page | None = None
+
+    def on_message(self, handler: Handler) -> None:
         """
         Register a handler for WebSocket messages.
 
         Args:
             handler: Async function to handle the message data
-                     Signature: async def handler(data: dict) -> None
+                     Signature: async def handler(data: Mapping) -> None
 
         Example:
-            async def handle_ws_message(data: dict) -> None:
+            async def handle_ws_message(data: Mapping) -> None:
                 if data.get('type') == 'score':
                     print(f"Score update: {data}")
 
             ws_interceptor.on_message(handle_ws_message)
         """
-        self.handlers.append(handler)
+        self.handlers = self.handlers + (handler,)
+        self._rebuild_routes()
         logger.debug("Registered WebSocket message handler")
 
+    def on_raw_message(self, handler: RawHandler) -> None:
+        """
+        Register a handler that receives the parsed message and the raw frame.
+
+        Useful for handlers that store or forward the payload as-is, so they
+        do not have to serialize the parsed dict again.
+
+        Args:
+            handler: Async function to handle the message
+                     Signature: async def handler(data: Mapping, raw: str | bytes) -> None
+        """
+        self.raw_handlers = self.raw_handlers + (handler,)
+        logger.debug("Registered raw WebSocket message handler")
+
     async def attach(self, page: Page) -> None:
         """
         Attach interceptor to a Playwright page.
@@ -47,9 +119,34 @@ class WebSocketInterceptor:
         Args:
             page: Playwright page to monitor
         """
+        self._page = page
         page.on("websocket", self._on_websocket)
+        # Playwright's async API fires websocket, frame and close events on
+        # this loop's thread, so _on_frame_received enqueues with a plain
+        # put_nowait and the socket set is mutated directly: no task per
+        # frame and no call_soon_threadsafe round-trip are needed.
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
         logger.info("WebSocket interceptor attached to page")
 
+    async def detach(self) -> None:
+        """Stop listening for new sockets and shut down the dispatch worker."""
+        if self._page:
+            self._page.remove_listener("websocket", self._on_websocket)
+            self._page = None
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        logger.info("WebSocket interceptor detached")
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been dispatched."""
+        await self._queue.join()
+
     async def _on_websocket(self, ws: WebSocket) -> None:
         """
         Internal handler for WebSocket connections.
@@ -59,7 +156,7 @@ class WebSocketInterceptor:
         """
         url = ws.url
         logger.info(f"WebSocket connection opened: {url}")
-        self._active_sockets.append(ws)
+        self._active_sockets.add(ws)
 
         # Register event handlers for this WebSocket
         ws.on("framereceived", lambda payload: self._on_frame_received(ws, payload))
@@ -88,49 +185,144 @@ class WebSocketInterceptor:
             payload: Frame payload
         """
         try:
-            # Payload is a string, parse it as JSON
-            text = payload
-            if isinstance(payload, bytes):
-                text = payload.decode("utf-8")
+            # Checked once so the per-frame f-strings are only built when
+            # debug logging is actually on
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"WS frame received from {ws.url}")
+
+            if payload.lstrip()[:1] not in _JSON_STARTS:
+                if debug:
+                    logger.debug(f"Non-JSON WebSocket message: {payload[:100]!r}")
+                return
+
+            if not self._wants_frame(payload):
+                return
 
-            logger.debug(f"WS frame received from {ws.url}")
+            # Both parsers accept bytes, so binary frames skip a str decode
+            try:
+                data = _json.loads(payload)
+            except ValueError:  # json and orjson decode errors both subclass it
+                logger.debug(f"Non-JSON WebSocket message: {payload[:100]!r}")
+                return
 
-            # Try to parse as JSON
             try:
-                data = json.loads(text)
-                # Process the message asynchronously
-                asyncio.create_task(self._process_message(data, ws))
-            except json.JSONDecodeError:
-                logger.debug(f"Non-JSON WebSocket message: {text[:100]}")
+                self._queue.put_nowait((data, ws, payload))
+            except asyncio.QueueFull:
+                self._dropped += 1
+                logger.warning(
+                    f"WebSocket queue full, dropping message from {ws.url} "
+                    f"({self._dropped} dropped so far)"
+                )
         except Exception as e:
             logger.error(f"Error processing received frame: {e}", exc_info=True)
 
-    async def _process_message(self, data: dict, ws: WebSocket) -> None:
+    async def _drain(self) -> None:
+        """
+        Long-lived worker that feeds queued messages to _process_message.
+
+        With ``ws_coalesce_window`` set, frames arriving within the window
+        after the first one are collected and passed through _coalesce
+        before dispatch.
+        """
+        window = settings.ws_coalesce_window
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                if window > 0:
+                    await asyncio.sleep(window)
+                    while not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                    messages = self._coalesce(batch)
+                else:
+                    messages = batch
+                for data, ws, raw in messages:
+                    await self._process_message(data, ws, raw)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _coalesce(self, batch: list[tuple]) -> list[tuple]:
+        """
+        Merge queued messages that supersede each other.
+
+        Args:
+            batch: Queued (data, ws, raw) tuples in arrival order
+
+        Returns:
+            Tuples to dispatch, in arrival order
+        """
+        return batch
+
+    async def _process_message(
+        self, data: dict, ws: WebSocket, raw: str | bytes | None = None
+    ) -> None:
         """
         Process a WebSocket message.
 
         Args:
             data: Parsed message data
             ws: WebSocket instance
+            raw: Original frame payload, passed to raw handlers
         """
         try:
-            logger.debug(f"Processing WS message: {data.get('type', 'unknown')}")
-
-            # Call all registered handlers
-            if self.handlers:
-                for handler in self.handlers:
-                    try:
-                        await handler(data)
-                    except Exception as e:
-                        logger.error(
-                            f"Handler error for WebSocket message: {e}", exc_info=True
-                        )
-            else:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing WS message: {data.get('type', 'unknown')}")
+
+            handlers = self._handlers_for(data)
+            raw_handlers = self.raw_handlers if raw is not None else ()
+            if not handlers and not raw_handlers:
                 logger.debug("No handlers registered for WebSocket messages")
+                return
+
+            # Handlers run concurrently on the same message, so they get a
+            # read-only view instead of each taking a defensive copy
+            view = MappingProxyType(data)
+
+            # Run handlers concurrently; one failing does not stop the others
+            results = await asyncio.gather(
+                *(handler(view) for handler in handlers),
+                *(handler(view, raw) for handler in raw_handlers),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"Handler error for WebSocket message: {result}",
+                        exc_info=result,
+                    )
 
         except Exception as e:
             logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
 
+    def _handlers_for(self, data: dict) -> tuple[Handler, ...]:
+        """
+        Select the handlers that should receive a message.
+
+        Args:
+            data: Parsed message data
+
+        Returns:
+            Handlers to call for this message
+        """
+        return self.handlers
+
+    def _rebuild_routes(self) -> None:
+        """Hook for subclasses that precompute per-type handler tuples."""
+
+    def _wants_frame(self, payload: str | bytes) -> bool:
+        """
+        Decide, before parsing, whether a frame can reach any handler.
+
+        Args:
+            payload: Raw frame payload
+
+        Returns:
+            False only if the frame is certain to be ignored
+        """
+        # Nothing subscribed yet (startup) or any more (shutdown)
+        return bool(self.handlers or self.raw_handlers)
+
     def _on_close(self, ws: WebSocket) -> None:
         """
         Handle WebSocket close event.
@@ -139,8 +331,7 @@ class WebSocketInterceptor:
             ws: WebSocket instance
         """
         logger.info(f"WebSocket connection closed: {ws.url}")
-        if ws in self._active_sockets:
-            self._active_sockets.remove(ws)
+        self._active_sockets.discard(ws)
 
     def remove_handler(self, handler: Callable) -> None:
         """
@@ -150,12 +341,18 @@ class WebSocketInterceptor:
             handler: Handler function to remove
         """
         if handler in self.handlers:
-            self.handlers.remove(handler)
+            self.handlers = _without(self.handlers, handler)
+            self._rebuild_routes()
             logger.debug("Removed WebSocket message handler")
+        if handler in self.raw_handlers:
+            self.raw_handlers = _without(self.raw_handlers, handler)
+            logger.debug("Removed raw WebSocket message handler")
 
     def clear_handlers(self) -> None:
         """Clear all message handlers."""
-        self.handlers.clear()
+        self.handlers = ()
+        self.raw_handlers = ()
+        self._rebuild_routes()
         logger.debug("Cleared all WebSocket message handlers")
 
     @property
@@ -163,6 +360,11 @@ class WebSocketInterceptor:
         """Get count of active WebSocket connections."""
         return len(self._active_sockets)
 
+    @property
+    def dropped(self) -> int:
+        """Get count of messages dropped because the queue was full."""
+        return self._dropped
+
 
 class LiveScoreWebSocketInterceptor(WebSocketInterceptor):
     """
@@ -174,56 +376,130 @@ class LiveScoreWebSocketInterceptor(WebSocketInterceptor):
     def __init__(self):
         """Initialize live score WebSocket interceptor."""
         super().__init__()
-        self.score_handlers: list[Callable[[dict], Awaitable[None]]] = []
-        self.incident_handlers: list[Callable[[dict], Awaitable[None]]] = []
-
-    def on_score_update(self, handler: Callable[[dict], Awaitable[None]]) -> None:
+        self.score_handlers: tuple[Handler, ...] = ()
+        self.incident_handlers: tuple[Handler, ...] = ()
+        # Message type -> every handler it dispatches to (generic + typed).
+        # Rebuilt on registration so dispatch is one lookup, no concatenation
+        self._routes: dict[str, tuple[Handler, ...]] = {}
+
+    def _rebuild_routes(self) -> None:
+        """Map every score/incident type variant to its combined handlers."""
+        score = self.handlers + self.score_handlers
+        incident = self.handlers + self.incident_handlers
+        self._routes = {
+            **dict.fromkeys(_SCORE_TYPES, score),
+            **dict.fromkeys(_INCIDENT_TYPES, incident),
+        }
+
+    def on_score_update(self, handler: Handler) -> None:
         """
         Register handler for score updates.
 
         Args:
             handler: Async function to handle score updates
         """
-        self.score_handlers.append(handler)
+        self.score_handlers = self.score_handlers + (handler,)
+        self._rebuild_routes()
         logger.debug("Registered score update handler")
 
-    def on_incident(self, handler: Callable[[dict], Awaitable[None]]) -> None:
+    def on_incident(self, handler: Handler) -> None:
         """
         Register handler for match incidents.
 
         Args:
             handler: Async function to handle incidents
         """
-        self.incident_handlers.append(handler)
+        self.incident_handlers = self.incident_handlers + (handler,)
+        self._rebuild_routes()
         logger.debug("Registered incident handler")
 
-    async def _process_message(self, data: dict, ws: WebSocket) -> None:
+    def _handlers_for(self, data: dict) -> tuple[Handler, ...]:
         """
-        Process WebSocket message with type filtering.
+        Select generic handlers plus the score or incident handlers matching
+        the message type, so all of them run in a single gather.
 
         Args:
             data: Parsed message data
-            ws: WebSocket instance
+
+        Returns:
+            Handlers to call for this message
+        """
+        return self._routes.get(data.get("type", ""), self.handlers)
+
+    def _coalesce(self, batch: list[tuple]) -> list[tuple]:
+        """
+        Merge score updates for the same event within a batch.
+
+        Score frames carry partial data (score, status or time), so their
+        ``data`` objects are merged with later values winning rather than
+        keeping only the last frame. Incidents and other messages are never
+        merged. Skipped when raw handlers are registered, since a merged
+        message has no single raw frame.
+
+        Args:
+            batch: Queued (data, ws, raw) tuples in arrival order
+
+        Returns:
+            Tuples to dispatch, in arrival order
+        """
+        if len(batch) < 2 or self.raw_handlers:
+            return batch
+
+        merged: dict[object, tuple] = {}
+        for index, (data, ws, raw) in enumerate(batch):
+            payload = data.get("data")
+            event_id = payload.get("eventId") if isinstance(payload, dict) else None
+            if data.get("type") not in _SCORE_TYPES or event_id is None:
+                merged[index] = (data, ws, raw)
+                continue
+
+            key = (event_id, data["type"])
+            previous = merged.get(key)
+            if previous is not None:
+                data = {
+                    **previous[0],
+                    **data,
+                    "data": {**previous[0]["data"], **payload},
+                }
+                raw = None
+            merged[key] = (data, ws, raw)
+        return list(merged.values())
+
+    def _wants_frame(self, payload: str | bytes) -> bool:
+        """
+        Skip parsing frames whose type no registered handler is interested in.
+
+        Only applies when there are no generic or raw handlers, which see
+        every message. The "type" values are scanned in the raw payload; any
+        occurrence that is not laid out exactly as ``"type":"...`` is left
+        to the parser.
+
+        Args:
+            payload: Raw frame payload
+
+        Returns:
+            False only if the frame is certain to be ignored
         """
-        # Call parent processing
-        await super()._process_message(data, ws)
-
-        # Handle specific message types
-        message_type = data.get("type", "")
-
-        if message_type in ("score", "scoreChange", "scoreUpdate"):
-            for handler in self.score_handlers:
-                try:
-                    await handler(data)
-                except Exception as e:
-                    logger.error(f"Score handler error: {e}", exc_info=True)
-
-        elif message_type in ("incident", "incidentChange", "newIncident"):
-            for handler in self.incident_handlers:
-                try:
-                    await handler(data)
-                except Exception as e:
-                    logger.error(f"Incident handler error: {e}", exc_info=True)
+        if self.handlers or self.raw_handlers:
+            return True
+        if not (self.score_handlers or self.incident_handlers):
+            return False
+        sniff = _TYPE_SNIFF.get(type(payload))
+        if sniff is None:
+            return True
+        key, separator, quote, routed = sniff
+
+        pos = payload.find(key)
+        while pos >= 0:
+            start = pos + len(key)
+            if payload[start : start + 2] != separator:
+                return True
+            start += 2
+            end = payload.find(quote, start)
+            if end < 0 or payload[start:end] in routed:
+                return True
+            pos = payload.find(key, end)
+        return False
 
 
 async def create_ws_interceptor(
@@ -6,10 +6,8 @@ import logging
 import random
 from playwright.async_api import Page
 
-import re
-
 from src.browser.manager import BrowserManager
-from src.browser.interceptor import ResponseInterceptor
+from src.browser.interceptor import ParsedRoute, ResponseInterceptor
 from src.browser.ws_interceptor import WebSocketInterceptor
 from src.browser.header_capture import HeaderCapture
 from src.browser.api_fetcher import DirectApiFetcher
@@ -169,9 +167,11 @@ class BaseCollector(ABC):
 
         if self.http_interceptor:
             self.http_interceptor.clear_handlers()
+            await self.http_interceptor.detach()
 
         if self.ws_interceptor:
             self.ws_interceptor.clear_handlers()
+            await self.ws_interceptor.detach()
 
         if self.page and not self.page.is_closed():
             await self.page.close()
@@ -229,7 +229,7 @@ class BaseCollector(ABC):
         sport: str | None = None,
         date: str | None = None,
         url: str | None = None,
-    ) -> tuple[dict, "re.Match"] | None:
+    ) -> tuple[dict, ParsedRoute] | None:
         """Attempt a direct API fetch using the captured token.
 
         Returns ``(data, match)`` on success, or ``None`` when direct fetch is
@@ -2,10 +2,10 @@
 
 import asyncio
 import logging
-import re
 from datetime import date, timedelta
 from typing import Any
 
+from src.browser.interceptor import ParsedRoute
 from src.collectors.base import BaseCollector
 from src.browser.manager import BrowserManager
 from src.config import settings
@@ -45,7 +45,7 @@ class DailyEventsCollector(BaseCollector):
             start_date: Start date for collection (defaults to today)
             end_date: End date for collection (defaults to start_date)
             on_scheduled_data: Async callback for scheduled match data
-                              Signature: async def(data: dict, match: re.Match) -> None
+                              Signature: async def(data: dict, match: ParsedRoute) -> None
             backfill_mode: If True, uses backfill delay between requests
 
         Example:
@@ -195,13 +195,13 @@ class DailyEventsCollector(BaseCollector):
 
         logger.debug(f"Data collection complete for {date_str}")
 
-    async def _handle_scheduled_response(self, data: dict, match: re.Match) -> None:
+    async def _handle_scheduled_response(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle intercepted scheduled events HTTP response.
 
         Args:
             data: JSON response data
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
                    Group 1: sport
                    Group 2: date (YYYY-MM-DD)
         """
@@ -278,7 +278,7 @@ async def create_daily_collector(
 
     Example:
         # Collect upcoming week
-        async def handle_scheduled(data: dict, match: re.Match) -> None:
+        async def handle_scheduled(data: dict, match: ParsedRoute) -> None:
             events = data.get('events', [])
             print(f"Scheduled matches: {len(events)}")
 
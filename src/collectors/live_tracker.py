@@ -2,9 +2,10 @@
 
 import asyncio
 import logging
-import re
+from collections.abc import Mapping
 from typing import Any
 
+from src.browser.interceptor import ParsedRoute
 from src.collectors.base import BaseCollector
 from src.browser.manager import BrowserManager
 from src.config import settings
@@ -52,13 +53,13 @@ class LiveTracker(BaseCollector):
             browser_manager: BrowserManager instance
             sport: Sport to track (e.g., 'football', 'tennis')
             on_live_data: Async callback for live match data from HTTP responses
-                          Signature: async def(data: dict, match: re.Match) -> None
+                          Signature: async def(data: dict, match: ParsedRoute) -> None
             on_scheduled_data: Async callback for scheduled match data from HTTP responses
-                              Signature: async def(data: dict, match: re.Match) -> None
+                              Signature: async def(data: dict, match: ParsedRoute) -> None
             on_featured_data: Async callback for featured match data from HTTP responses
-                             Signature: async def(data: dict, match: re.Match) -> None
+                             Signature: async def(data: dict, match: ParsedRoute) -> None
             on_inverse_data: Async callback for inverse scheduled match data from HTTP responses
-                            Signature: async def(data: dict, match: re.Match) -> None
+                            Signature: async def(data: dict, match: ParsedRoute) -> None
             on_score_update: Async callback for WebSocket score updates
                            Signature: async def(data: dict) -> None
             on_incident: Async callback for WebSocket incident updates
@@ -240,13 +241,13 @@ class LiveTracker(BaseCollector):
                 logger.error(f"Error refreshing page for {self.sport}: {e}")
                 # Continue trying despite errors
 
-    async def _handle_live_response(self, data: dict, match: re.Match) -> None:
+    async def _handle_live_response(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle intercepted live events HTTP response.
 
         Args:
             data: JSON response data
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         try:
             sport_from_url = match.group(1) if match.lastindex and match.lastindex >= 1 else None
@@ -272,13 +273,13 @@ class LiveTracker(BaseCollector):
                 f"Error handling live response for {self.sport}: {e}", exc_info=True
             )
 
-    async def _handle_scheduled_response(self, data: dict, match: re.Match) -> None:
+    async def _handle_scheduled_response(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle intercepted scheduled events HTTP response.
 
         Args:
             data: JSON response data
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         try:
             sport_from_url = match.group(1) if match.lastindex and match.lastindex >= 1 else None
@@ -304,13 +305,13 @@ class LiveTracker(BaseCollector):
                 f"Error handling scheduled response for {self.sport}: {e}", exc_info=True
             )
 
-    async def _handle_featured_response(self, data: dict, match: re.Match) -> None:
+    async def _handle_featured_response(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle intercepted featured events HTTP response.
 
         Args:
             data: JSON response data
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         try:
             sport_from_url = match.group(1) if match.lastindex and match.lastindex >= 1 else None
@@ -336,13 +337,13 @@ class LiveTracker(BaseCollector):
                 f"Error handling featured response for {self.sport}: {e}", exc_info=True
             )
 
-    async def _handle_inverse_response(self, data: dict, match: re.Match) -> None:
+    async def _handle_inverse_response(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle intercepted inverse scheduled events HTTP response.
 
         Args:
             data: JSON response data
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         try:
             sport_from_url = match.group(1) if match.lastindex and match.lastindex >= 1 else None
@@ -368,7 +369,7 @@ class LiveTracker(BaseCollector):
                 f"Error handling inverse response for {self.sport}: {e}", exc_info=True
             )
 
-    async def _handle_ws_message(self, data: dict) -> None:
+    async def _handle_ws_message(self, data: Mapping) -> None:
         """
         Handle WebSocket message (fallback for generic interceptor).
 
@@ -435,7 +436,7 @@ async def create_live_tracker(
         LiveTracker instance (already started)
 
     Example:
-        async def handle_live_matches(data: dict, match: re.Match) -> None:
+        async def handle_live_matches(data: dict, match: ParsedRoute) -> None:
             events = data.get('events', [])
             print(f"Live matches: {len(events)}")
 
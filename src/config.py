@@ -68,6 +68,9 @@ class Settings(BaseSettings):
     context_idle_timeout: float = 600.0  # Context idle timeout in seconds (10 min)
 
     max_queue_size: int = 1000  # Maximum size for interceptor queues
+    # Seconds to collect WebSocket frames before dispatch so bursts of score
+    # updates for one event are merged into one; 0 dispatches every frame
+    ws_coalesce_window: float = 0.0
 
     cleanup_interval: float = 60.0  # Run cleanup every N seconds
 
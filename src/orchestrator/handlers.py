@@ -1,7 +1,7 @@
 """Data handlers that bridge interceptors → parsers → database repositories."""
 
 import logging
-import re
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 
@@ -22,6 +22,7 @@ from src.storage.repositories import (
     IncidentRepository,
 )
 from src.storage.file_storage import FileStorageService
+from src.browser.interceptor import ParsedRoute
 from src.config import settings
 
 logger = logging.getLogger(__name__)
@@ -69,7 +70,7 @@ class DataHandler:
         if self._should_close_session and session:
             session.close()
 
-    async def handle_live_events(self, data: dict, match: re.Match) -> None:
+    async def handle_live_events(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle live events HTTP response.
 
@@ -77,7 +78,7 @@ class DataHandler:
 
         Args:
             data: JSON response data from /api/v1/sport/{sport}/events/live
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         session = None
         try:
@@ -210,7 +211,7 @@ class DataHandler:
         finally:
             self._close_session_if_needed(session)
 
-    async def handle_scheduled_events(self, data: dict, match: re.Match) -> None:
+    async def handle_scheduled_events(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle scheduled events HTTP response.
 
@@ -218,7 +219,7 @@ class DataHandler:
 
         Args:
             data: JSON response data from /api/v1/sport/{sport}/scheduled-events/{date}
-            match: Regex match object containing URL groups (sport, date)
+            match: Parsed route of the intercepted URL (sport, date)
         """
         session = None
         try:
@@ -355,7 +356,7 @@ class DataHandler:
         finally:
             self._close_session_if_needed(session)
 
-    async def handle_featured_events(self, data: dict, match: re.Match) -> None:
+    async def handle_featured_events(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle featured events HTTP response.
 
@@ -363,7 +364,7 @@ class DataHandler:
 
         Args:
             data: JSON response data from /api/v1/odds/{id}/featured-events/{sport}
-            match: Regex match object containing URL groups
+            match: Parsed route of the intercepted URL
         """
         session = None
         try:
@@ -495,7 +496,7 @@ class DataHandler:
         finally:
             self._close_session_if_needed(session)
 
-    async def handle_inverse_events(self, data: dict, match: re.Match) -> None:
+    async def handle_inverse_events(self, data: dict, match: ParsedRoute) -> None:
         """
         Handle inverse scheduled events HTTP response.
 
@@ -503,7 +504,7 @@ class DataHandler:
 
         Args:
             data: JSON response data from /api/v1/sport/{sport}/scheduled-events/{date}/inverse
-            match: Regex match object containing URL groups (sport, date)
+            match: Parsed route of the intercepted URL (sport, date)
         """
         session = None
         try:
@@ -641,7 +642,7 @@ class DataHandler:
         finally:
             self._close_session_if_needed(session)
 
-    async def handle_score_update(self, data: dict) -> None:
+    async def handle_score_update(self, data: Mapping) -> None:
         """
         Handle WebSocket score update.
 
@@ -712,7 +713,7 @@ class DataHandler:
         finally:
             self._close_session_if_needed(session)
 
-    async def handle_incident(self, data: dict) -> None:
+    async def handle_incident(self, data: Mapping) -> None:
         """
         Handle WebSocket incident (goal, card, substitution, etc.).
 
@@ -1,6 +1,7 @@
 """Parser for SofaScore WebSocket messages."""
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 from datetime import datetime
 
@@ -81,7 +82,7 @@ class WebSocketMessageParser:
         }
 
     @classmethod
-    def parse_score_update(cls, message: dict) -> dict[str, Any]:
+    def parse_score_update(cls, message: Mapping) -> dict[str, Any]:
         """
         Parse a score update WebSocket message.
 
@@ -147,7 +148,7 @@ class WebSocketMessageParser:
         }
 
     @classmethod
-    def parse_incident(cls, message: dict) -> dict[str, Any]:
+    def parse_incident(cls, message: Mapping) -> dict[str, Any]:
         """
         Parse an incident WebSocket message (goal, card, substitution, etc.).
 
@@ -215,7 +216,7 @@ class WebSocketMessageParser:
             return {"error": str(e), "raw_message": message}
 
     @classmethod
-    def parse_message(cls, message: dict) -> dict[str, Any]:
+    def parse_message(cls, message: Mapping) -> dict[str, Any]:
         """
         Parse any WebSocket message and route to appropriate parser.
 
@@ -252,7 +253,7 @@ class WebSocketMessageParser:
             return {"error": str(e), "raw_message": message}
 
     @staticmethod
-    def is_score_update(message: dict) -> bool:
+    def is_score_update(message: Mapping) -> bool:
         """
         Check if message is a score update.
 
@@ -265,7 +266,7 @@ class WebSocketMessageParser:
         return message.get("type", "") in WebSocketMessageParser.SCORE_UPDATE_TYPES
 
     @staticmethod
-    def is_incident(message: dict) -> bool:
+    def is_incident(message: Mapping) -> bool:
         """
         Check if message is an incident.
 
@@ -278,7 +279,7 @@ class WebSocketMessageParser:
         return message.get("type", "") in WebSocketMessageParser.INCIDENT_TYPES
 
     @staticmethod
-    def is_status_change(message: dict) -> bool:
+    def is_status_change(message: Mapping) -> bool:
         """
         Check if message is a status change.
 
@@ -292,7 +293,7 @@ class WebSocketMessageParser:
 
 
 # Convenience functions
-def parse_ws_message(message: dict) -> dict[str, Any]:
+def parse_ws_message(message: Mapping) -> dict[str, Any]:
     """
     Parse any WebSocket message.
 
@@ -305,7 +306,7 @@ def parse_ws_message(message: dict) -> dict[str, Any]:
     return WebSocketMessageParser.parse_message(message)
 
 
-def parse_score_update(message: dict) -> dict[str, Any]:
+def parse_score_update(message: Mapping) -> dict[str, Any]:
     """
     Parse a score update WebSocket message.
 
@@ -318,7 +319,7 @@ def parse_score_update(message: dict) -> dict[str, Any]:
     return WebSocketMessageParser.parse_score_update(message)
 
 
-def parse_incident(message: dict) -> dict[str, Any]:
+def parse_incident(message: Mapping) -> dict[str, Any]:
     """
     Parse an incident WebSocket message.
 
@@ -439,5 +439,7 @@ def init_db():
         return
 
     engine = get_engine()
-    Base.metadata.create_all(engine)
+    # Run all DDL in a single transaction
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn)
     print("Database initialized successfully")
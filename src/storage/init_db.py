@@ -3,6 +3,8 @@
 import logging
 from pathlib import Path
 
+from sqlalchemy import inspect
+
 from src.storage.database import init_db, get_engine, is_postgresql
 from src.config import settings
 
@@ -51,10 +53,7 @@ def main():
         raise
 
     # Verify tables were created
-    engine = get_engine()
-    from sqlalchemy import inspect
-
-    inspector = inspect(engine)
+    inspector = inspect(get_engine())
     tables = inspector.get_table_names()
 
     logger.info(f"Created {len(tables)} tables:")
@@ -0,0 +1 @@
+"""Browser interceptor tests module."""
@@ -0,0 +1,256 @@
+"""HTTP response interceptor tests."""
+
+import asyncio
+import logging
+
+import pytest
+from playwright._impl._impl_to_api_mapping import ImplToApiMapping
+
+from src.browser.interceptor import (
+    API_PATTERNS,
+    ParsedRoute,
+    ResponseInterceptor,
+    parse_api_url,
+)
+from src.config import settings
+
+LIVE_URL = "https://www.sofascore.com/api/v1/sport/football/events/live"
+INVERSE_URL = (
+    "https://www.sofascore.com/api/v1/sport/football/"
+    "scheduled-events/2026-01-15/inverse"
+)
+
+
+def _route_from_patterns(path: str) -> ParsedRoute | None:
+    """Classify a path with the reference regexes in API_PATTERNS."""
+    for name, pattern in API_PATTERNS.items():
+        match = pattern.search(path)
+        if match:
+            return ParsedRoute(name, *match.groups())
+    return None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.sofascore.com/api/v1/sport/football/scheduled-events/2026-01-15",
+        INVERSE_URL,
+        LIVE_URL,
+        "https://www.sofascore.com/api/v1/sport/ice-hockey/events/live",
+        "https://www.sofascore.com/api/v1/odds/1/featured-events/football",
+        "https://www.sofascore.com/api/v1/sport/football/events/live?_=1700000000",
+        "https://www.sofascore.com/api/v1/odds/1/featured-events/tennis?x=1&y=2",
+        # Negatives
+        "https://www.sofascore.com/api/v1/sport/foo bar/events/live",
+        "https://www.sofascore.com/api/v1/sport/foo.bar/events/live",
+        "https://www.sofascore.com/api/v1/sport//events/live",
+        "https://www.sofascore.com/api/v1/sport/football/events/live/",
+        "https://www.sofascore.com/api/v1/sport/football/events/live/extra",
+        "https://www.sofascore.com/api/v1/sport/football/scheduled-events/2026-1-15",
+        "https://www.sofascore.com/api/v1/sport/football/scheduled-events/"
+        "\uff12\uff10\uff12\uff16-01-15",
+        "https://www.sofascore.com/api/v1/sport/football/scheduled-events/"
+        "2026-01-15/inverse/",
+        "https://www.sofascore.com/api/v1/odds/\u0661/featured-events/football",
+        "https://www.sofascore.com/api/v1/odds/x/featured-events/football",
+        "https://www.sofascore.com/api/v1/odds/1/featured-events/",
+        "https://www.sofascore.com/api/v1/odds/1/featured-events/foo/bar",
+        "https://www.sofascore.com/api/v1/event/123/statistics",
+        "https://www.sofascore.com/static/images/logo.png",
+    ],
+)
+def test_parse_api_url_matches_patterns(url):
+    """Test parse_api_url accepts exactly what API_PATTERNS accepts."""
+    path = url.partition("?")[0]
+
+    assert parse_api_url(path) == _route_from_patterns(path)
+
+
+class StubRequest:
+    """Request stub carrying only the resource type."""
+
+    def __init__(self, resource_type: str = "fetch"):
+        self.resource_type = resource_type
+
+
+class StubResponse:
+    """Response stub that counts body reads."""
+
+    def __init__(self, url: str = LIVE_URL, body: bytes = b'{"events": []}'):
+        self.url = url
+        self.ok = True
+        self.status = 200
+        self.headers = {"content-type": "application/json; charset=utf-8"}
+        self.request = StubRequest()
+        self._body = body
+        self.body_reads = 0
+
+    async def body(self) -> bytes:
+        self.body_reads += 1
+        return self._body
+
+
+class StubPage:
+    """Page stub recording event listeners."""
+
+    def __init__(self):
+        self.listeners: dict = {}
+        self.context = None
+
+    def on(self, event: str, callback) -> None:
+        self.listeners[event] = callback
+
+    def remove_listener(self, event: str, callback) -> None:
+        self.listeners.pop(event, None)
+
+
+async def test_queue_full_drops_response(monkeypatch):
+    """Test responses are dropped and counted once the queue is full."""
+    monkeypatch.setattr(settings, "max_queue_size", 1)
+    interceptor = ResponseInterceptor()
+
+    # No worker attached, so nothing consumes the queue
+    for _ in range(3):
+        await interceptor._on_response(StubResponse())
+
+    assert interceptor._queue.qsize() == 1
+    assert interceptor.dropped == 2
+
+
+async def test_drain_waits_for_dispatch():
+    """Test drain() returns only after queued responses reached handlers."""
+    received = []
+
+    async def handler(data, route):
+        received.append((data, route))
+
+    page = StubPage()
+    interceptor = ResponseInterceptor()
+    interceptor.on("live", handler)
+    await interceptor.attach(page)
+    try:
+        await page.listeners["response"](StubResponse())
+        await interceptor.drain()
+
+        assert received == [({"events": []}, ParsedRoute("live", "football"))]
+    finally:
+        await interceptor.detach()
+
+    assert "response" not in page.listeners
+
+
+async def test_no_handler_skips_body_read():
+    """Test the body is not read when no handler is registered."""
+    interceptor = ResponseInterceptor()
+    response = StubResponse()
+
+    await interceptor._process_response(response, ParsedRoute("live", "football"))
+
+    assert response.body_reads == 0
+
+
+async def test_handler_error_does_not_stop_others(caplog):
+    """Test a failing handler is logged and the others still run."""
+    received = []
+
+    async def failing(data, route):
+        raise RuntimeError("boom")
+
+    async def working(data, route):
+        received.append(data)
+
+    interceptor = ResponseInterceptor()
+    interceptor.on("live", failing)
+    interceptor.on("live", working)
+
+    with caplog.at_level(logging.ERROR, logger="src.browser.interceptor"):
+        await interceptor._process_response(
+            StubResponse(), ParsedRoute("live", "football")
+        )
+
+    assert received == [{"events": []}]
+    assert any("boom" in record.getMessage() for record in caplog.records)
+
+
+async def test_register_exact_skips_url_parsing(monkeypatch):
+    """Test a pre-registered URL is routed without calling parse_api_url."""
+    url = LIVE_URL + "?_=1"
+    interceptor = ResponseInterceptor()
+    interceptor.register_exact(url, "live")
+
+    def fail(path):
+        pytest.fail("parse_api_url must not run for a registered URL")
+
+    monkeypatch.setattr("src.browser.interceptor.parse_api_url", fail)
+    await interceptor._on_response(StubResponse(url))
+
+    response, route = interceptor._queue.get_nowait()
+    assert response.url == url
+    assert route == ParsedRoute("live", "football")
+
+
+def test_register_exact_unknown_pattern():
+    """Test registering a URL under an unknown pattern fails."""
+    interceptor = ResponseInterceptor()
+
+    with pytest.raises(ValueError, match="Unknown pattern"):
+        interceptor.register_exact(LIVE_URL, "statistics")
+
+
+def test_register_exact_pattern_mismatch():
+    """Test registering a URL under a pattern it does not match fails."""
+    interceptor = ResponseInterceptor()
+
+    with pytest.raises(ValueError, match="does not match"):
+        interceptor.register_exact(LIVE_URL, "scheduled")
+
+
+def test_playwright_can_wrap_bound_listener():
+    """Test Playwright can cache its listener wrapper on the interceptor."""
+    interceptor = ResponseInterceptor()
+
+    # What page.on("response", interceptor._on_response) does internally
+    wrapper = ImplToApiMapping().wrap_handler(interceptor._on_response)
+
+    assert ImplToApiMapping().wrap_handler(interceptor._on_response) is wrapper
+
+
+async def test_detach_cancels_inverse_fetch():
+    """Test detach() cancels inverse fetches and closes their tab."""
+    loading = asyncio.Event()
+
+    class BlockingTab:
+        closed = False
+
+        async def goto(self, url):
+            loading.set()
+            await asyncio.Event().wait()
+
+        async def close(self):
+            self.closed = True
+
+    tab = BlockingTab()
+
+    class StubContext:
+        async def new_page(self):
+            return tab
+
+    async def handler(data, route):
+        pytest.fail("inverse handler must not run")
+
+    page = StubPage()
+    page.context = StubContext()
+    interceptor = ResponseInterceptor()
+    interceptor.on("inverse", handler)
+    await interceptor.attach(page)
+
+    await page.listeners["response"](StubResponse(INVERSE_URL))
+    await interceptor.drain()
+    await asyncio.wait_for(loading.wait(), timeout=1)
+    (task,) = interceptor._inverse_tasks
+
+    await interceptor.detach()
+
+    assert task.cancelled()
+    assert tab.closed
+    assert not interceptor._inverse_tasks
@@ -0,0 +1,218 @@
+"""WebSocket interceptor tests."""
+
+import logging
+from types import MappingProxyType
+
+import pytest
+
+from src.browser.ws_interceptor import (
+    LiveScoreWebSocketInterceptor,
+    WebSocketInterceptor,
+)
+from src.config import settings
+
+SCORE_FRAME = '{"type":"score","data":{"eventId":1}}'
+
+
+async def _handler(data):
+    """No-op message handler."""
+
+
+class StubPage:
+    """Page stub recording event listeners."""
+
+    def __init__(self):
+        self.listeners: dict = {}
+
+    def on(self, event: str, callback) -> None:
+        self.listeners[event] = callback
+
+    def remove_listener(self, event: str, callback) -> None:
+        self.listeners.pop(event, None)
+
+
+def test_queue_full_drops_frame(monkeypatch, mock_websocket):
+    """Test frames are dropped and counted once the queue is full."""
+    monkeypatch.setattr(settings, "max_queue_size", 1)
+    interceptor = WebSocketInterceptor()
+    interceptor.on_message(_handler)
+
+    # No worker attached, so nothing consumes the queue
+    for _ in range(3):
+        interceptor._on_frame_received(mock_websocket, SCORE_FRAME)
+
+    assert interceptor._queue.qsize() == 1
+    assert interceptor.dropped == 2
+
+
+async def test_drain_waits_for_handlers(mock_websocket):
+    """Test drain() returns once handlers got a read-only view of the frame."""
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    page = StubPage()
+    interceptor = WebSocketInterceptor()
+    interceptor.on_message(handler)
+    await interceptor.attach(page)
+    try:
+        interceptor._on_frame_received(mock_websocket, SCORE_FRAME)
+        await interceptor.drain()
+    finally:
+        await interceptor.detach()
+
+    assert len(received) == 1
+    assert isinstance(received[0], MappingProxyType)
+    assert received[0] == {"type": "score", "data": {"eventId": 1}}
+
+
+async def test_handler_error_does_not_stop_others(mock_websocket, caplog):
+    """Test a failing handler is logged and the others still run."""
+    received = []
+
+    async def failing(data):
+        raise RuntimeError("boom")
+
+    async def working(data):
+        received.append(data)
+
+    page = StubPage()
+    interceptor = WebSocketInterceptor()
+    interceptor.on_message(failing)
+    interceptor.on_message(working)
+    await interceptor.attach(page)
+    try:
+        with caplog.at_level(logging.ERROR, logger="src.browser.ws_interceptor"):
+            interceptor._on_frame_received(mock_websocket, SCORE_FRAME)
+            await interceptor.drain()
+    finally:
+        await interceptor.detach()
+
+    assert len(received) == 1
+    assert any("boom" in record.getMessage() for record in caplog.records)
+
+
+async def test_detach_stops_listening():
+    """Test detach() removes the page listener and cancels the worker."""
+    page = StubPage()
+    interceptor = WebSocketInterceptor()
+    await interceptor.attach(page)
+    worker = interceptor._worker
+    assert "websocket" in page.listeners
+
+    await interceptor.detach()
+
+    assert "websocket" not in page.listeners
+    assert worker.cancelled()
+    assert interceptor._worker is None
+
+
+@pytest.mark.parametrize("payload", ['[{"type": "score"}]', b"  [1, 2]", "[]"])
+def test_array_frames_are_not_queued(payload, mock_websocket):
+    """Test JSON arrays are rejected before parsing instead of reaching handlers."""
+    interceptor = WebSocketInterceptor()
+    interceptor.on_message(_handler)
+
+    interceptor._on_frame_received(mock_websocket, payload)
+
+    assert interceptor._queue.empty()
+
+
+def _live_interceptor() -> LiveScoreWebSocketInterceptor:
+    """Live score interceptor with only a score handler registered."""
+    interceptor = LiveScoreWebSocketInterceptor()
+    interceptor.on_score_update(_handler)
+    return interceptor
+
+
+@pytest.mark.parametrize(
+    ("payload", "wanted"),
+    [
+        ('{"type":"score","data":{}}', True),
+        ('{"type":"incident","data":{}}', True),
+        ('{"type":"odds","data":{}}', False),
+        ('{"data":{"eventId":1}}', False),
+        # A nested "type" ahead of the top-level one
+        ('{"data":{"type":"goal"},"type":"score"}', True),
+        ('{"data":{"type":"goal"},"type":"odds"}', False),
+        ('{"data":{"type":"score"},"type":"odds"}', True),
+        # Any layout other than "type":"..." is left to the parser
+        ('{"type": "odds"}', True),
+        ('{"type":1}', True),
+        ('{"type":"sco', True),
+    ],
+)
+@pytest.mark.parametrize("as_bytes", [False, True], ids=["str", "bytes"])
+def test_wants_frame_sniffs_type(payload, wanted, as_bytes):
+    """Test routed types are spotted the same way in str and bytes frames."""
+    interceptor = _live_interceptor()
+
+    assert interceptor._wants_frame(payload.encode() if as_bytes else payload) is wanted
+
+
+def test_wants_frame_without_handlers():
+    """Test every frame is skipped while nothing is subscribed."""
+    interceptor = LiveScoreWebSocketInterceptor()
+
+    assert interceptor._wants_frame('{"type":"score"}') is False
+
+
+@pytest.mark.parametrize("register", ["on_message", "on_raw_message"])
+def test_wants_frame_with_generic_or_raw_handler(register):
+    """Test generic and raw handlers get every frame, routed or not."""
+    interceptor = _live_interceptor()
+    getattr(interceptor, register)(_handler)
+
+    assert interceptor._wants_frame('{"type":"odds"}') is True
+    assert interceptor._wants_frame(b'{"type":"odds"}') is True
+
+
+def _score(event_id: int, **data) -> dict:
+    """Score update message for an event."""
+    return {"type": "scoreChange", "data": {"eventId": event_id, **data}}
+
+
+def test_coalesce_merges_score_updates(mock_websocket):
+    """Test score frames for the same event merge, later values winning."""
+    interceptor = _live_interceptor()
+    first = _score(1, homeScore={"current": 1}, status={"type": "inprogress"})
+    other = _score(2, homeScore={"current": 0})
+    batch = [
+        (first, mock_websocket, "raw-1"),
+        (other, mock_websocket, "raw-2"),
+        (_score(1, homeScore={"current": 2}), mock_websocket, "raw-3"),
+    ]
+
+    result = interceptor._coalesce(batch)
+
+    assert result == [
+        (
+            _score(1, homeScore={"current": 2}, status={"type": "inprogress"}),
+            mock_websocket,
+            None,
+        ),
+        (other, mock_websocket, "raw-2"),
+    ]
+
+
+def test_coalesce_keeps_every_incident(mock_websocket):
+    """Test incidents for the same event are never merged."""
+    interceptor = _live_interceptor()
+    goal = {"type": "incident", "data": {"eventId": 1, "incidentType": "goal"}}
+    card = {"type": "incident", "data": {"eventId": 1, "incidentType": "card"}}
+    batch = [(goal, mock_websocket, "raw-1"), (card, mock_websocket, "raw-2")]
+
+    assert interceptor._coalesce(batch) == batch
+
+
+def test_coalesce_skipped_with_raw_handlers(mock_websocket):
+    """Test nothing is merged when raw handlers need every original frame."""
+    interceptor = _live_interceptor()
+    interceptor.on_raw_message(_handler)
+    batch = [
+        (_score(1, homeScore={"current": 1}), mock_websocket, "raw-1"),
+        (_score(1, homeScore={"current": 2}), mock_websocket, "raw-2"),
+    ]
+
+    assert interceptor._coalesce(batch) == batch
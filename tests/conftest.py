@@ -1,58 +1,38 @@
 """
 Pytest configuration și fixtures globale pentru toate testele.
+
+Copiii unui AsyncMock sunt creați leneș (tot ca AsyncMock) la primul acces,
+așa că fixture-urile setează explicit doar atributele care trebuie să fie
+sincrone (MagicMock) sau să aibă o valoare anume.
 """
 
 import pytest
-import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """
-    Creează un event loop pentru sesiunea de teste.
-    Necesar pentru testele async cu pytest-asyncio.
-    """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def mock_playwright():
     """Mock pentru Playwright instance."""
-    mock = AsyncMock()
-    mock.chromium = AsyncMock()
-    mock.stop = AsyncMock()
-    return mock
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_browser():
     """Mock pentru Browser instance."""
-    mock = AsyncMock()
-    mock.new_context = AsyncMock()
-    mock.close = AsyncMock()
-    return mock
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_context():
     """Mock pentru BrowserContext instance."""
-    mock = AsyncMock()
-    mock.new_page = AsyncMock()
-    mock.close = AsyncMock()
-    return mock
+    return AsyncMock()
 
 
 @pytest.fixture
 def mock_page():
     """Mock pentru Page instance."""
     mock = AsyncMock()
-    mock.goto = AsyncMock()
-    mock.wait_for_load_state = AsyncMock()
     mock.on = MagicMock()
-    mock.close = AsyncMock()
     return mock
 
 
@@ -68,45 +48,43 @@ def mock_response():
     return mock
 
 
+class FakeWebSocket:
+    """
+    Stub ușor pentru WebSocket: doar url și callback-urile înregistrate.
+    Mult mai ieftin de construit decât un AsyncMock.
+    """
+
+    def __init__(self, url: str = "wss://www.sofascore.com/ws"):
+        self.url = url
+        self.callbacks: dict = {}
+
+    def on(self, event: str, callback) -> None:
+        self.callbacks[event] = callback
+
+
 @pytest.fixture
 def mock_websocket():
-    """Mock pentru WebSocket instance."""
-    mock = AsyncMock()
-    mock.url = "wss://www.sofascore.com/ws"
-    mock.on = MagicMock()
-    return mock
+    """Stub pentru WebSocket instance."""
+    return FakeWebSocket()
 
 
 @pytest.fixture
 def mock_browser_manager():
     """Mock pentru BrowserManager instance."""
     from src.browser.manager import BrowserManager
-    mock = AsyncMock(spec=BrowserManager)
-    mock.new_page = AsyncMock()
-    mock.create_context = AsyncMock()
-    mock.get_context = AsyncMock()
-    mock.close_context = AsyncMock()
-    mock.shutdown = AsyncMock()
-    return mock
+    return AsyncMock(spec=BrowserManager)
 
 
 @pytest.fixture
 def mock_http_interceptor():
     """Mock pentru HTTP ResponseInterceptor instance."""
-    mock = MagicMock()
-    mock.on = MagicMock()
-    mock.clear_handlers = MagicMock()
-    return mock
+    return MagicMock()
 
 
 @pytest.fixture
 def mock_ws_interceptor():
     """Mock pentru WebSocket interceptor instance."""
     mock = MagicMock()
-    mock.on_message = MagicMock()
-    mock.on_score_update = MagicMock()
-    mock.on_incident = MagicMock()
-    mock.clear_handlers = MagicMock()
     mock.active_connections = 0
     return mock
 